@@ -37,23 +37,25 @@ spaces.
 """
 
 
+PANGRAM = 'The quick brown fox jumps over the lazy dog'
+BRAILLE = (
+    '000001011110110010100010'
+    '000000111110101001010100'
+    '100100101000000000110000'
+    '111010101010010111101110'
+    '000000110100101010101101'
+    '000000010110101001101100'
+    '111100011100000000101010'
+    '111001100010111010000000'
+    '011110110010100010000000'
+    '111000100000101011101111'
+    '000000100110101010110110'
+)
+
+
 def solution(string):
     """Encode a string into Braille."""
-    pangram = 'The quick brown fox jumps over the lazy dog'
-    braille = (
-        '000001011110110010100010'
-        '000000111110101001010100'
-        '100100101000000000110000'
-        '111010101010010111101110'
-        '000000110100101010101101'
-        '000000010110101001101100'
-        '111100011100000000101010'
-        '111001100010111010000000'
-        '011110110010100010000000'
-        '111000100000101011101111'
-        '000000100110101010110110'
-    )
-    return Translator(pangram, braille).encode(string)
+    return _TRANSLATOR.encode(string)
 
 
 class Translator:
@@ -62,42 +64,41 @@ class Translator:
     def __init__(self, pangram, braille):
         self._pangram = pangram
         self._braille = braille
-        self._cap_mark = object()
         self._table = self._make_table()
 
     @property
     def table(self):
-        """A table of Braille codes for each character."""
+        """A translation table of Braille codes keyed by code point."""
         return self._table
 
     def encode(self, string):
         """Encode a string into Braille."""
-        return ''.join(self._encode(string))
-
-    def _encode(self, string):
-        for char in string:
-            if char.isupper():
-                yield self.table[self._cap_mark]
-                yield self.table[char.lower()]
-            else:
-                yield self.table[char]
+        return string.translate(self.table)
 
     def _make_table(self):
         """Create a table of Braille codes for each character in the
-        pangram.
+        pangram, with the capitalization mark baked into uppercase letters.
         """
         table = {}
         codes = _chunk(self._braille, 6)
+        cap_mark, index = '', 0
         for char in self._pangram:
             if char.isupper():
-                table[self._cap_mark] = next(codes)
-                table[char.lower()] = next(codes)
+                cap_mark = codes[index]
+                table[ord(char.lower())] = codes[index + 1]
+                index += 2
             else:
-                table[char] = next(codes)
+                table[ord(char)] = codes[index]
+                index += 1
+
+        for char in map(chr, range(ord('a'), ord('z') + 1)):
+            table[ord(char.upper())] = cap_mark + table[ord(char)]
 
         return table
 
 
 def _chunk(string, size):
-    for i in range(0, len(string), size):
-        yield string[i:i + size]
+    return tuple(string[i:i + size] for i in range(0, len(string), size))
+
+
+_TRANSLATOR = Translator(PANGRAM, BRAILLE)
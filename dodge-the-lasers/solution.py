@@ -45,29 +45,45 @@ in front of you, but on what you don't.
 """
 
 
-from decimal import Decimal, getcontext
+from functools import lru_cache
+from math import isqrt
+
+
+SCALE = 10**200
+SQRT_2 = isqrt(2 * SCALE**2)
 
 
 def solution(str_n):
     """Return the sum of the first n terms of a Beatty sequence with
     sqrt(2).
     """
-    getcontext().prec = 101
-    return str(sum_beatty_sequence(int(str_n), Decimal(2).sqrt()))
-
-
-def sum_beatty_sequence(number, irrational_number):
-    """Sum of the first n terms of a Beatty sequence."""
-    if number == 0:
-        return 0
-
-    n_prime = int((irrational_number - 1) * number)
-    return (
-        number * n_prime
-        + number * (number + 1) // 2
-        - n_prime * (n_prime + 1) // 2
-        - sum_beatty_sequence(n_prime, irrational_number)
-    )
+    return str(sum_beatty_sequence(int(str_n)))
+
+
+@lru_cache(maxsize=None)
+def sum_beatty_sequence(number):
+    """Sum of the first n terms of a Beatty sequence with sqrt(2), which is
+    scaled by SCALE so the whole computation stays in integers.
+    """
+    numbers = [number]
+    while numbers[-1]:
+        numbers.append(SQRT_2 * numbers[-1] // SCALE - numbers[-1])
+
+    total = 0
+    for number, n_prime in zip(numbers[-2::-1], numbers[:0:-1]):
+        total = (
+            number * n_prime
+            + triangular(number)
+            - triangular(n_prime)
+            - total
+        )
+
+    return total
+
+
+def triangular(number):
+    """Return the sum of the integers from 1 to number."""
+    return number * (number + 1) >> 1
 
 
 if __name__ == '__main__':
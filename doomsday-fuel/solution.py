@@ -58,6 +58,7 @@ from copy import deepcopy
 from fractions import Fraction
 from functools import reduce
 from math import gcd
+from operator import mul
 
 
 def solution(matrix):
@@ -67,10 +68,11 @@ def solution(matrix):
 
     transition_matrix = normalize(matrix)
     q_matrix, r_matrix = canonical_form(transition_matrix)
-    identity = IdentityMatrix(q_matrix.shape[0])
-    n_matrix = (identity - q_matrix) ** -1
-    b_matrix = n_matrix * r_matrix
-    probabilities = b_matrix[0]
+    size = q_matrix.shape[0]
+    identity = IdentityMatrix(size)
+    start = Matrix([[1 if i == 0 else 0] for i in range(size)])
+    n_row = (identity - q_matrix).transpose().solve(start).transpose()
+    probabilities = (n_row * r_matrix)[0]
     denominator = lcm(fraction.denominator for fraction in probabilities)
     return [*(
         int(probability * denominator)
@@ -131,44 +133,33 @@ class Matrix:
     def __add__(self, other):
         """Add two matrices."""
         return Matrix([
-            [
-                self.matrix[i][j] + other.matrix[i][j]
-                for j in range(len(self.matrix[i]))
-            ]
-            for i in range(len(self.matrix))
+            [value + other_value for value, other_value in zip(row, other_row)]
+            for row, other_row in zip(self.matrix, other.matrix)
         ])
 
     def __sub__(self, other):
         """Subtract two matrices."""
         return Matrix([
-            [
-                self.matrix[i][j] - other.matrix[i][j]
-                for j in range(len(self.matrix[i]))
-            ]
-            for i in range(len(self.matrix))
+            [value - other_value for value, other_value in zip(row, other_row)]
+            for row, other_row in zip(self.matrix, other.matrix)
         ])
 
     def __mul__(self, other):
         """Multiply two matrices or a matrix with scalar."""
         if isinstance(other, (int, Fraction)):
             return Matrix([
-                [
-                    self.matrix[i][j] * other
-                    for j in range(len(self.matrix[i]))
-                ]
-                for i in range(len(self.matrix))
+                [value * other for value in row]
+                for row in self.matrix
             ])
 
         if isinstance(other, Matrix):
+            columns = list(zip(*other.matrix))
             return Matrix([
                 [
-                    sum(
-                        self.matrix[i][k] * other.matrix[k][j]
-                        for k in range(len(self.matrix[i]))
-                    )
-                    for j in range(len(other.matrix[0]))
+                    sum(map(mul, row, column))
+                    for column in columns
                 ]
-                for i in range(len(self.matrix))
+                for row in self.matrix
             ])
 
         raise NotImplementedError
@@ -193,30 +184,36 @@ class Matrix:
 
     @property
     def determinant(self):
-        """Return the determinant of the matrix."""
-        if self.shape == (1, 1):
-            return self.matrix[0][0]
-
-        if self.shape == (2, 2):
-            return (
-                self.matrix[0][0] * self.matrix[1][1]
-                - self.matrix[0][1] * self.matrix[1][0]
-            )
+        """Return the determinant of the matrix using Bareiss elimination."""
+        size = self.shape[0]
+        rows = [[Fraction(value) for value in row] for row in self.matrix]
+        sign, previous = 1, 1
 
-        return sum(
-            (-1)**i * self.matrix[0][i] * self.minor(0, i).determinant
-            for i in range(self.shape[0])
-        )
+        for k in range(size - 1):
+            if rows[k][k] == 0:
+                pivot = next(
+                    (i for i in range(k + 1, size) if rows[i][k] != 0),
+                    None,
+                )
+                if pivot is None:
+                    return Fraction(0)
+
+                rows[k], rows[pivot] = rows[pivot], rows[k]
+                sign = -sign
+
+            for i in range(k + 1, size):
+                for j in range(k + 1, size):
+                    rows[i][j] = (
+                        rows[i][j] * rows[k][k] - rows[i][k] * rows[k][j]
+                    ) / previous
+
+            previous = rows[k][k]
+
+        return sign * rows[-1][-1]
 
     def transpose(self):
         """Return the transpose of the matrix."""
-        return Matrix([
-            [
-                self.matrix[j][i]
-                for j in range(self.shape[0])
-            ]
-            for i in range(self.shape[1])
-        ])
+        return Matrix([list(column) for column in zip(*self.matrix)])
 
     def minor(self, i, j):
         """Return the minor matrix of the element."""
@@ -245,20 +242,47 @@ class Matrix:
         return self.cofactor().transpose()
 
     def inverse(self):
-        """Return the inverse of the matrix."""
-        determinant = self.determinant
-        if self.shape == (1, 1):
-            return Matrix([
-                [Fraction(1, determinant)]
-            ])
+        """Return the inverse of the matrix using Gauss-Jordan elimination."""
+        return self.solve(IdentityMatrix(self.shape[0]))
+
+    def solve(self, other):
+        """Return the matrix X such that self * X == other using
+        Gauss-Jordan elimination.
+        """
+        size = self.shape[0]
+        augmented = [
+            [Fraction(value) for value in row + other_row]
+            for row, other_row in zip(self.matrix, other.matrix)
+        ]
+
+        for column in range(size):
+            pivot = next(
+                (
+                    row for row in range(column, size)
+                    if augmented[row][column] != 0
+                ),
+                None,
+            )
+            if pivot is None:
+                raise ValueError('Matrix is singular')
 
-        if self.shape == (2, 2):
-            return Matrix([
-                [self.matrix[1][1], -self.matrix[0][1]],
-                [-self.matrix[1][0], self.matrix[0][0]],
-            ]) * Fraction(1, determinant)
+            augmented[column], augmented[pivot] = (
+                augmented[pivot], augmented[column]
+            )
+            pivot_value = augmented[column][column]
+            pivot_row = augmented[column] = [
+                value / pivot_value for value in augmented[column]
+            ]
+
+            for row in range(size):
+                factor = augmented[row][column]
+                if row != column and factor != 0:
+                    augmented[row] = [
+                        value - factor * entry
+                        for value, entry in zip(augmented[row], pivot_row)
+                    ]
 
-        return self.adjoint() * Fraction(1, determinant)
+        return Matrix([row[size:] for row in augmented])
 
 
 class IdentityMatrix(Matrix):
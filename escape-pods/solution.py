@@ -51,117 +51,117 @@ same.)
 """
 
 
-from collections import defaultdict, deque
-
-
-INF = float('inf')
-SOURCE = object()
-SINK = object()
-
-
 def solution(entrances, exits, path):
     """Find the  maximum bunnies that can escape at each time step."""
     graph = create_graph(entrances, exits, path)
-    return max_flow(graph)
+    return max_flow(graph, source=len(path), sink=len(path) + 1)
 
 
 def create_graph(entrances, exits, path):
-    """Create a weighted graph with a single source and sink."""
-    graph = defaultdict(dict)
+    """Create a capacity matrix with a single source and sink appended as
+    the last two nodes.
+    """
+    size = len(path)
+    source, sink = size, size + 1
+    # No flow can exceed the total corridor capacity, so it stands in for
+    # infinity while keeping every capacity an int.
+    unbounded = sum(map(sum, path))
+    graph = [row + [0, 0] for row in path]
+    graph += [[0] * (size + 2) for _ in range(2)]
 
     for entrance in entrances:
-        graph[SOURCE][entrance] = INF
+        graph[source][entrance] = unbounded
 
     for exit_ in exits:
-        graph[exit_][SINK] = INF
-
-    for i, row in enumerate(path):
-        for j, capacity in enumerate(row):
-            graph[i][j] = capacity
+        graph[exit_][sink] = unbounded
 
     return graph
 
 
-def max_flow(graph):
-    """Find the maximum flow from source to sink using Ford-Fulkerson
-    algorithm.
-    """
-    forward = make_forward(graph)
-    backward = transpose(forward)
-    weights = defaultdict(int)
-
-    def update_state(path, flow):
-        node = SINK
-        while node != SOURCE:
-            node, neighbor = path[node], node
-            if neighbor in forward[node]:
-                weights[node, neighbor] += flow
-            else:
-                weights[neighbor, node] -= flow
+def max_flow(graph, source, sink):
+    """Find the maximum flow from source to sink using Dinic's algorithm."""
+    size = len(graph)
+    flows = [[0] * size for _ in range(size)]
+    neighbors = [
+        [
+            neighbor
+            for neighbor in range(size)
+            if graph[node][neighbor] or graph[neighbor][node]
+        ]
+        for node in range(size)
+    ]
 
     while True:
-        path, flow = bfs(graph, forward, backward, weights)
-        if flow == 0:
+        levels = bfs(graph, flows, neighbors, source)
+        if levels[sink] < 0:
             break
 
-        update_state(path, flow)
+        arcs = [
+            [
+                neighbor
+                for neighbor in neighbors[node]
+                if levels[neighbor] == levels[node] + 1
+                and graph[node][neighbor] - flows[node][neighbor]
+            ]
+            for node in range(size)
+        ]
+        while augment(graph, flows, arcs, source, sink):
+            pass
 
-    return sum(weights[SOURCE, neighbor] for neighbor in forward[SOURCE])
+    return sum(flows[source])
 
 
-def make_forward(graph):
-    """Create a graph with only forward edges."""
-    return {
-        node: {
-            neighbor
-            for neighbor, capacity in neighbor_to_capacity.items()
-            if capacity
-        }
-        for node, neighbor_to_capacity in graph.items()
-    }
-
-
-def transpose(graph):
-    """Reverse the direction of the edges in the graph."""
-    backward = defaultdict(set)
-    for node, neighbors in graph.items():
-        for neighbor in neighbors:
-            backward[neighbor].add(node)
-    return backward
-
-
-def bfs(graph, forward, backward, weights):
-    """Find the shortest path and its flow value from source to sink."""
-    path = {SOURCE: None}
-    flows = {SOURCE: INF}
-    queue = deque([SOURCE])
-
-    def update_state(neighbor, weight):
-        if neighbor in path or weight == 0:
-            return
-
-        path[neighbor] = node
-        flows[neighbor] = min(flows[node], weight)
-        queue.append(neighbor)
-
-    while queue:
-        node = queue.popleft()
-        if node == SINK:
-            return path, flows[SINK]
-
-        for neighbor in forward[node]:
-            update_state(
-                neighbor,
-                graph[node][neighbor] - weights[node, neighbor],
-            )
-
-        for neighbor in backward[node]:
-            update_state(
-                neighbor,
-                weights[neighbor, node],
-            )
-
-    return None, 0
+def augment(graph, flows, arcs, source, sink):
+    """Push flow along a path of the level graph from source to sink and
+    return its value, or 0 if the level graph is exhausted.
+    """
+    path = [source]
+    while path:
+        node = path[-1]
+        if node == sink:
+            edges = list(zip(path, path[1:]))
+            flow = min(graph[u][v] - flows[u][v] for u, v in edges)
+            for u, v in edges:
+                flows[u][v] += flow
+                flows[v][u] -= flow
+
+            return flow
+
+        node_arcs = arcs[node]
+        while node_arcs and not (
+            graph[node][node_arcs[-1]] - flows[node][node_arcs[-1]]
+        ):
+            node_arcs.pop()
+
+        if node_arcs:
+            path.append(node_arcs[-1])
+            continue
+
+        path.pop()
+        if path:
+            arcs[path[-1]].pop()
+
+    return 0
+
+
+def bfs(graph, flows, neighbors, source):
+    """Find the level of each node, i.e. its distance from source over
+    edges with residual capacity, or -1 if it is unreachable.
+    """
+    levels = [-1] * len(graph)
+    levels[source] = 0
+    queue = [source]
+
+    for node in queue:
+        for neighbor in neighbors[node]:
+            if (
+                levels[neighbor] < 0
+                and graph[node][neighbor] - flows[node][neighbor]
+            ):
+                levels[neighbor] = levels[node] + 1
+                queue.append(neighbor)
+
+    return levels
 
 
 if __name__ == '__main__':
@@ -33,32 +33,30 @@ solution(15) returns 5: 15 -> 16 -> 8 -> 4 -> 2 -> 1
 """
 
 
-from collections import deque
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1024)
 def solution(pallets):
     """Return the minimum number of operations needed to transform the
     number of pellets to 1.
     """
-    queue, seen = deque([(int(pallets), 0)]), set()
-    while queue:
-        pallets, operations = queue.popleft()
-        if pallets == 1:
-            return operations
-
-        if pallets in seen:
+    pallets, operations = int(pallets), 0
+    while pallets > 1:
+        if pallets & 1 == 0:
+            zeros = (pallets & -pallets).bit_length() - 1
+            pallets >>= zeros
+            operations += zeros
             continue
 
-        seen.add(pallets)
-        operations += 1
-
-        if pallets % 2 == 0:
-            queue.append((pallets // 2, operations))
+        if pallets == 3 or pallets & 3 == 1:
+            pallets -= 1
         else:
-            queue.append((pallets + 1, operations))
-            queue.append((pallets - 1, operations))
+            pallets += 1
+
+        operations += 1
 
-    raise ValueError('No solution found')
+    return operations
 
 
 if __name__ == '__main__':
@@ -19,32 +19,38 @@ The same digit may appear multiple times in the list, but each element in the
 list may only be used once.
 """
 
-from itertools import permutations
+from itertools import chain
 
 
 def solution(digits):
     """Find the largest number divisible by 3."""
-    for candidate in iter_candidates(digits):
-        if candidate % 3 == 0:
-            return candidate
+    buckets = [[], [], []]
+    for digit in sorted(digits):
+        buckets[digit % 3].append(digit)
 
-    return 0
+    remainder = sum(digits) % 3
+    if remainder and not remove_remainder(buckets, remainder):
+        return 0
 
+    kept = sorted(chain.from_iterable(buckets), reverse=True)
+    return to_number(kept) if kept else 0
 
-def iter_candidates(digits):
-    """Generate all possible candidates from highest to lowest."""
-    sorted_digits = sorted(digits, reverse=True)
-    for size in range(len(sorted_digits), 0, -1):
-        seen = set()
-        for candidate in permutations(sorted_digits, r=size):
-            if candidate not in seen:
-                seen.add(candidate)
-                yield to_number(candidate)
+
+def remove_remainder(buckets, remainder):
+    """Remove the fewest and smallest digits from the ascending residue
+    buckets so that the sum of the remaining digits is divisible by 3.
+    """
+    for residue, count in ((remainder, 1), (3 - remainder, 2)):
+        if len(buckets[residue]) >= count:
+            del buckets[residue][:count]
+            return True
+
+    return False
 
 
 def to_number(digits):
     """Convert a list of digits to a number."""
-    return sum(d * 10**i for i, d in enumerate(reversed(digits)))
+    return int(''.join(map(str, digits)))
 
 
 if __name__ == '__main__':